@@ -0,0 +1,29 @@
+"""Add doctor search indexes
+
+Revision ID: 4b7e2d91c3a5
+Revises: 10954fa7d713
+Create Date: 2026-10-15 09:12:44.318027
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '4b7e2d91c3a5'
+down_revision: Union[str, None] = '10954fa7d713'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+    op.create_index('ix_doctors_specialty_trgm', 'doctors', ['specialty'], unique=False, postgresql_using='gin', postgresql_ops={'specialty': 'gin_trgm_ops'})
+    op.create_index('ix_doctors_city_trgm', 'doctors', ['city'], unique=False, postgresql_using='gin', postgresql_ops={'city': 'gin_trgm_ops'})
+
+
+def downgrade() -> None:
+    op.drop_index('ix_doctors_city_trgm', table_name='doctors')
+    op.drop_index('ix_doctors_specialty_trgm', table_name='doctors')
@@ -0,0 +1,34 @@
+"""Add symptom condition mapping keys
+
+Revision ID: 9e1c5a7f2b80
+Revises: 4b7e2d91c3a5
+Create Date: 2026-10-15 10:03:27.905114
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9e1c5a7f2b80'
+down_revision: Union[str, None] = '4b7e2d91c3a5'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_foreign_key('symptom_condition_mapping_symptom_id_fkey', 'symptom_condition_mapping', 'symptoms', ['symptom_id'], ['id'])
+    op.create_foreign_key('symptom_condition_mapping_condition_id_fkey', 'symptom_condition_mapping', 'conditions', ['condition_id'], ['id'])
+    op.create_index(op.f('ix_symptom_condition_mapping_symptom_id'), 'symptom_condition_mapping', ['symptom_id'], unique=False)
+    op.create_index(op.f('ix_symptom_condition_mapping_condition_id'), 'symptom_condition_mapping', ['condition_id'], unique=False)
+    op.create_index('ix_scm_pair', 'symptom_condition_mapping', ['symptom_id', 'condition_id'], unique=True)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_scm_pair', table_name='symptom_condition_mapping')
+    op.drop_index(op.f('ix_symptom_condition_mapping_condition_id'), table_name='symptom_condition_mapping')
+    op.drop_index(op.f('ix_symptom_condition_mapping_symptom_id'), table_name='symptom_condition_mapping')
+    op.drop_constraint('symptom_condition_mapping_condition_id_fkey', 'symptom_condition_mapping', type_='foreignkey')
+    op.drop_constraint('symptom_condition_mapping_symptom_id_fkey', 'symptom_condition_mapping', type_='foreignkey')
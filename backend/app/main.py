@@ -1,12 +1,14 @@
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from app.config import settings
-from app.routes import doctors, complete_kiosk  
+from app.routes import doctors, complete_kiosk, realtime_kiosk
 
 app = FastAPI(
     title="AI Medical Kiosk - LIVE CAMERA",
     version="3.0.0",
-    description="Real-time medical kiosk with live camera processing"
+    description="Real-time medical kiosk with live camera processing",
+    default_response_class=ORJSONResponse
 )
 
 # CORS middleware
@@ -21,6 +23,7 @@ app.add_middleware(
 # Include routers
 app.include_router(doctors.router)
 app.include_router(complete_kiosk.router)
+app.include_router(realtime_kiosk.router)
 
 @app.get("/")
 async def root():
@@ -1,10 +1,18 @@
 from sqlalchemy import create_engine
+from sqlalchemy.engine import make_url
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 from app.config import settings
 
+# Rows per multi-VALUES INSERT: larger pages mean fewer round-trips, but wide rows
+# make each statement (and the server's parse memory) grow; 1000 suits our narrow tables
+engine_options = {"insertmanyvalues_page_size": 1000}
+if make_url(settings.DATABASE_URL).get_driver_name() == "psycopg2":
+    # Batch executemany() for UPDATE/DELETE too; INSERTs already use multi-VALUES
+    engine_options.update(executemany_mode="values_plus_batch", executemany_batch_page_size=500)
+
 # Create engine with your connection string
-engine = create_engine(settings.DATABASE_URL)
+engine = create_engine(settings.DATABASE_URL, **engine_options)
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 Base = declarative_base()
 
@@ -14,4 +22,4 @@ def get_db():
     try:
         yield db
     finally:
-        db.close()
\ No newline at end of file
+        db.close()
@@ -1,9 +1,14 @@
-from sqlalchemy import Column, Integer, String, Text, Numeric, DateTime
+from sqlalchemy import Column, Integer, String, Text, Numeric, DateTime, Index
 from sqlalchemy.sql import func
 from .database import Base
 
 class Doctor(Base):
     __tablename__ = "doctors"
+    __table_args__ = (
+        # Trigram GIN indexes back the ILIKE '%...%' filters in /doctors on PostgreSQL
+        Index("ix_doctors_specialty_trgm", "specialty", postgresql_using="gin", postgresql_ops={"specialty": "gin_trgm_ops"}),
+        Index("ix_doctors_city_trgm", "city", postgresql_using="gin", postgresql_ops={"city": "gin_trgm_ops"}),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     name = Column(String(100), nullable=False)
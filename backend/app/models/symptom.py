@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Text, Boolean, DateTime
+from sqlalchemy import Column, Integer, String, Text, Boolean, DateTime, ForeignKey, Index
 from sqlalchemy.sql import func
 from .database import Base
 
@@ -26,9 +26,12 @@ class Condition(Base):
 
 class SymptomConditionMapping(Base):
     __tablename__ = "symptom_condition_mapping"
+    __table_args__ = (
+        Index("ix_scm_pair", "symptom_id", "condition_id", unique=True),
+    )
     
     id = Column(Integer, primary_key=True, index=True)
-    symptom_id = Column(Integer, nullable=False)
-    condition_id = Column(Integer, nullable=False)
+    symptom_id = Column(Integer, ForeignKey("symptoms.id"), nullable=False, index=True)
+    condition_id = Column(Integer, ForeignKey("conditions.id"), nullable=False, index=True)
     confidence_score = Column(Integer)  # 1-100 scale
     created_at = Column(DateTime(timezone=True), server_default=func.now())
\ No newline at end of file
@@ -1,20 +1,31 @@
 # backend/app/routes/complete_kiosk.py
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from http.client import HTTPException
 from pathlib import Path
 from fastapi import APIRouter
+from app.routes.realtime_kiosk import kiosk as realtime_kiosk
 from app.services.complete_kiosk import CompleteKiosk
 
 router = APIRouter(prefix="/kiosk", tags=["kiosk"])
 
+# Dedicated pool so long camera sessions don't starve FastAPI's shared threadpool
+kiosk_executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="complete-kiosk")
+
+def _run_complete_session():
+    # Share the realtime kiosk's camera so device 0 is only ever opened once
+    kiosk = CompleteKiosk(camera=realtime_kiosk.camera)
+    return kiosk.start_complete_session()
+
 @router.get("/start-session")
-def start_complete_kiosk_session():
+async def start_complete_kiosk_session():
     """
     SINGLE ENDPOINT - COMPLETE KIOSK EXPERIENCE
     Turns on camera → Detects user → Reads vitals → AI diagnosis → Doctor recommendations
     """
-    kiosk = CompleteKiosk()
-    result = kiosk.start_complete_session()
+    loop = asyncio.get_running_loop()
+    result = await loop.run_in_executor(kiosk_executor, _run_complete_session)
     return result
 
 # Add this to your routes
@@ -26,11 +37,12 @@ def list_user_photos():
     
     if photos_dir.exists():
         for file in photos_dir.glob("user_photo_*.jpg"):
+            stat = file.stat()  # One stat() per file instead of one per field
             photos.append({
                 "filename": file.name,
                 "file_path": str(file),
-                "size": file.stat().st_size,
-                "created": datetime.fromtimestamp(file.stat().st_ctime).isoformat()
+                "size": stat.st_size,
+                "created": datetime.fromtimestamp(stat.st_ctime).isoformat()
             })
     
     return {"photos": photos}
@@ -1,4 +1,5 @@
 from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy import bindparam, select
 from sqlalchemy.orm import Session
 from typing import List, Optional
 
@@ -8,15 +9,24 @@ from app.schemas.doctor import Doctor as DoctorSchema, DoctorList
 
 router = APIRouter(prefix="/doctors", tags=["doctors"])
 
+# Hot lookups built once at import and executed with bound parameters
+_DOCTOR_BY_ID = select(Doctor).where(Doctor.id == bindparam("doctor_id"))
+_DOCTORS_BY_SPECIALTY = select(Doctor).where(Doctor.specialty.ilike(bindparam("pattern")))
+
 @router.get("/", response_model=DoctorList)
 def get_doctors(
     skip: int = 0,
     limit: int = 100,
     specialty: Optional[str] = None,
     city: Optional[str] = None,
+    with_total: bool = False,
     db: Session = Depends(get_db)
 ):
-    """Get all doctors with optional filtering"""
+    """Get all doctors with optional filtering
+    
+    COUNT(*) is only run when `with_total` is set; otherwise `total` is the page size
+    and `has_next` tells the client whether another page exists.
+    """
     query = db.query(Doctor)
     
     if specialty:
@@ -24,15 +34,19 @@ def get_doctors(
     if city:
         query = query.filter(Doctor.city.ilike(f"%{city}%"))
     
-    total = query.count()
-    doctors = query.offset(skip).limit(limit).all()
+    # Fetch one extra row to detect a next page without a second round-trip
+    doctors = query.offset(skip).limit(limit + 1).all()
+    has_next = len(doctors) > limit
+    doctors = doctors[:limit]
+    
+    total = query.count() if with_total else len(doctors)
     
-    return DoctorList(doctors=doctors, total=total)
+    return DoctorList(doctors=doctors, total=total, has_next=has_next)
 
 @router.get("/{doctor_id}", response_model=DoctorSchema)
 def get_doctor(doctor_id: int, db: Session = Depends(get_db)):
     """Get a specific doctor by ID"""
-    doctor = db.query(Doctor).filter(Doctor.id == doctor_id).first()
+    doctor = db.execute(_DOCTOR_BY_ID, {"doctor_id": doctor_id}).scalar_one_or_none()
     if not doctor:
         raise HTTPException(status_code=404, detail="Doctor not found")
     return doctor
@@ -40,5 +54,5 @@ def get_doctor(doctor_id: int, db: Session = Depends(get_db)):
 @router.get("/specialty/{specialty}", response_model=DoctorList)
 def get_doctors_by_specialty(specialty: str, db: Session = Depends(get_db)):
     """Get doctors by specialty"""
-    doctors = db.query(Doctor).filter(Doctor.specialty.ilike(f"%{specialty}%")).all()
+    doctors = db.scalars(_DOCTORS_BY_SPECIALTY, {"pattern": f"%{specialty}%"}).all()
     return DoctorList(doctors=doctors, total=len(doctors))
\ No newline at end of file
@@ -1,5 +1,9 @@
 # backend/app/routes/realtime_kiosk.py
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
 from fastapi import APIRouter, BackgroundTasks
+from fastapi.responses import StreamingResponse
+from app.services.live_camera import FRAME_PERIOD
 from app.services.realtime_kiosk import RealTimeKiosk
 
 router = APIRouter(prefix="/realtime", tags=["realtime-kiosk"])
@@ -7,38 +11,68 @@ router = APIRouter(prefix="/realtime", tags=["realtime-kiosk"])
 # Global kiosk instance
 kiosk = RealTimeKiosk()
 
+# Bounded pool for the kiosk's long blocking waits, separate from FastAPI's threadpool
+kiosk_executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="realtime-kiosk")
+
+async def _run_blocking(func, *args):
+    """Run a long blocking kiosk call (face waits, sensor reads) on the kiosk executor"""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(kiosk_executor, func, *args)
+
+async def _run_quick(func, *args):
+    """Run a short kiosk call off the event loop, never queued behind the long waits"""
+    return await asyncio.to_thread(func, *args)
+
 @router.get("/start-session")
-def start_realtime_session():
+async def start_realtime_session():
     """Start real-time kiosk session with LIVE camera"""
-    result = kiosk.start_realtime_session()
+    result = await _run_blocking(kiosk.start_realtime_session)
     return result
 
 @router.get("/live-status")
-def get_live_status():
+async def get_live_status():
     """Get real-time camera status and live video frame"""
-    return kiosk.get_live_status()
+    return await _run_quick(kiosk.get_live_status)
+
+async def _mjpeg_stream():
+    """Yield each new camera frame as one part of a multipart MJPEG response"""
+    last_jpeg = None
+    while kiosk.session_active:
+        jpeg = await _run_quick(kiosk.camera.get_live_jpeg)
+        # The camera caches the encoded frame, so the same object means no new frame
+        if jpeg is not None and jpeg is not last_jpeg:
+            last_jpeg = jpeg
+            yield b"--frame\r\nContent-Type: image/jpeg\r\n\r\n" + jpeg + b"\r\n"
+        await asyncio.sleep(FRAME_PERIOD)
+
+@router.get("/live-feed")
+async def get_live_feed():
+    """Stream the live camera as MJPEG, usable directly as an <img> src"""
+    if not kiosk.session_active:
+        return {"error": "No active session"}
+    return StreamingResponse(_mjpeg_stream(), media_type="multipart/x-mixed-replace; boundary=frame")
 
 @router.post("/wait-for-user")
-def wait_for_user():
+async def wait_for_user():
     """Wait for user to appear in camera"""
-    return kiosk.wait_for_user(timeout=60)
+    return await _run_blocking(kiosk.wait_for_user, 60)
 
 @router.post("/capture-user")
-def capture_user_data():
+async def capture_user_data():
     """Capture user data once detected"""
-    return kiosk.capture_user_session()
+    return await _run_blocking(kiosk.capture_user_session)
 
 @router.post("/health-assessment")
-def perform_health_assessment():
+async def perform_health_assessment():
     """Perform real-time health assessment"""
-    return kiosk.process_health_assessment()
+    return await _run_blocking(kiosk.process_health_assessment)
 
 @router.post("/complete-session")
-def complete_kiosk_session():
+async def complete_kiosk_session():
     """Complete the entire kiosk session"""
-    return kiosk.complete_session()
+    return await _run_blocking(kiosk.complete_session)
 
 @router.post("/stop-session")
-def stop_session():
+async def stop_session():
     """Force stop the session"""
-    return kiosk.stop_session()
\ No newline at end of file
+    return await _run_quick(kiosk.stop_session)
\ No newline at end of file
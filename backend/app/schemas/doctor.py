@@ -27,4 +27,5 @@ class Doctor(DoctorBase):
 
 class DoctorList(BaseModel):
     doctors: list[Doctor]
-    total: int
\ No newline at end of file
+    total: int
+    has_next: bool = False
\ No newline at end of file
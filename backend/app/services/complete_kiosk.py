@@ -1,16 +1,44 @@
 # backend/app/services/complete_kiosk.py
-import cv2
 import time
 import random
-import base64
 import os
 from datetime import datetime
+from itertools import chain, combinations
 from pathlib import Path
+from typing import Optional
+from app.services.live_camera import LiveCameraSystem, encode_jpeg, to_jpeg_data_uri
+
+SPECIALTY_MAPPING = {
+    "Elevated blood pressure": ["Cardiology", "General Practice"],
+    "Slight fever detected": ["General Practice", "Internal Medicine"],
+    "Slightly elevated heart rate": ["Cardiology"]
+}
+
+def _build_concern_specialties(mapping):
+    """Precompute the specialties for every combination of known concerns"""
+    concerns = list(mapping)
+    table = {}
+    for combo in chain.from_iterable(combinations(concerns, r) for r in range(len(concerns) + 1)):
+        specialties = set()
+        for concern in combo:
+            specialties.update(mapping[concern])
+        table[frozenset(combo)] = tuple(specialties) if specialties else ("General Practice",)
+    return table
+
+# frozenset(concerns) -> specialties; 2^3 entries, looked up once per diagnosis
+CONCERN_SPECIALTIES = _build_concern_specialties(SPECIALTY_MAPPING)
 
 class CompleteKiosk:
-    def __init__(self):
-        self.cap = None
-        self.face_cascade = cv2.CascadeClassifier(cv2.data.haarcascades + 'haarcascade_frontalface_default.xml')
+    # Vital sign thresholds: (reading, upper limit, concern reported when exceeded)
+    VITAL_RULES = (
+        (lambda vitals: vitals["blood_pressure"]["systolic"], 130, "Elevated blood pressure"),
+        (lambda vitals: vitals["temperature"], 99.5, "Slight fever detected"),
+        (lambda vitals: vitals["heart_rate"], 80, "Slightly elevated heart rate"),
+    )
+    
+    def __init__(self, camera: Optional[LiveCameraSystem] = None):
+        # Reuse a running LiveCameraSystem when given one instead of opening the device again
+        self.camera = camera or LiveCameraSystem()
         self.photos_dir = Path("user_photos")
         self._setup_photos_directory()
     
@@ -29,11 +57,12 @@ class CompleteKiosk:
             "steps": []
         }
         
+        started_camera = False
         try:
             # STEP 1: Initialize Camera
             print("📷 Step 1: Initializing camera...")
-            self.cap = cv2.VideoCapture(0)
-            if not self.cap.isOpened():
+            started_camera = not self.camera.is_running
+            if started_camera and not self.camera.start_camera():
                 raise Exception("Camera not available")
             
             session_result["steps"].append({
@@ -86,9 +115,9 @@ class CompleteKiosk:
             session_result["message"] = "Kiosk session failed"
         
         finally:
-            # Always release camera
-            if self.cap:
-                self.cap.release()
+            # Always release camera, unless it was already running for someone else
+            if started_camera:
+                self.camera.stop_camera()
         
         return session_result
     
@@ -96,34 +125,27 @@ class CompleteKiosk:
         """Detect face and create user session"""
         start_time = time.time()
         
-        while time.time() - start_time < timeout:
-            ret, frame = self.cap.read()
-            if not ret:
-                continue
-            
-            # Convert to grayscale for face detection
-            gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
-            faces = self.face_cascade.detectMultiScale(gray, 1.1, 5, minSize=(100, 100))
-            
-            if len(faces) > 0:
-                print("✅ Face detected! Creating user session...")
-                
-                # Capture user photo and save to file
-                photo_info = self._save_user_photo(frame)
-                
-                return {
-                    "user_id": f"user_{int(time.time())}",
-                    "face_detected": True,
-                    "face_count": len(faces),
-                    "user_photo": photo_info["base64_data"],
-                    "photo_path": photo_info["file_path"],
-                    "photo_filename": photo_info["filename"],
-                    "detection_time": round(time.time() - start_time, 2)
-                }
-            
-            time.sleep(0.5)
+        # The camera loop already runs detection; just wait for it to report a face
+        if not self.camera.wait_for_face(timeout):
+            return None
+        
+        # Snapshot once; the camera loop may clear last_faces right after the wait returns
+        frame = self.camera.current_frame
+        face_count = max(1, len(self.camera.last_faces))
+        print("✅ Face detected! Creating user session...")
         
-        return None
+        # Capture user photo and save to file
+        photo_info = self._save_user_photo(frame)
+        
+        return {
+            "user_id": f"user_{int(time.time())}",
+            "face_detected": True,
+            "face_count": face_count,
+            "user_photo": photo_info["base64_data"],
+            "photo_path": photo_info["file_path"],
+            "photo_filename": photo_info["filename"],
+            "detection_time": round(time.time() - start_time, 2)
+        }
     
     def _save_user_photo(self, frame):
         """Save the user photo to disk and return base64 data"""
@@ -132,31 +154,28 @@ class CompleteKiosk:
         filename = f"user_photo_{timestamp}.jpg"
         file_path = self.photos_dir / filename
         
+        # Encode once and reuse the same JPEG bytes for the file and the API response
+        buffer = encode_jpeg(frame)
+        base64_data = to_jpeg_data_uri(buffer)
+        
         try:
             # Save the photo to file
-            cv2.imwrite(str(file_path), frame)
+            file_path.write_bytes(buffer)
             print(f"📸 Photo saved: {file_path}")
             
-            # Also create base64 version for API response
-            _, buffer = cv2.imencode('.jpg', frame)
-            base64_data = base64.b64encode(buffer).decode('utf-8')
-            
             return {
                 "filename": filename,
                 "file_path": str(file_path),
-                "base64_data": f"data:image/jpeg;base64,{base64_data}"
+                "base64_data": base64_data
             }
             
         except Exception as e:
             print(f"❌ Error saving photo: {e}")
             # Fallback: just return base64 data
-            _, buffer = cv2.imencode('.jpg', frame)
-            base64_data = base64.b64encode(buffer).decode('utf-8')
-            
             return {
                 "filename": "not_saved",
                 "file_path": "not_saved",
-                "base64_data": f"data:image/jpeg;base64,{base64_data}"
+                "base64_data": base64_data
             }
     
     def _read_medical_vitals(self):
@@ -175,19 +194,10 @@ class CompleteKiosk:
     
     def _ai_medical_analysis(self, vitals):
         """AI analysis of medical vitals and symptoms"""
-        concerns = []
-        
-        # Analyze blood pressure
-        if vitals["blood_pressure"]["systolic"] > 130:
-            concerns.append("Elevated blood pressure")
-        
-        # Analyze temperature
-        if vitals["temperature"] > 99.5:
-            concerns.append("Slight fever detected")
-        
-        # Analyze heart rate
-        if vitals["heart_rate"] > 80:
-            concerns.append("Slightly elevated heart rate")
+        concerns = [
+            concern for reading, threshold, concern in self.VITAL_RULES
+            if reading(vitals) > threshold
+        ]
         
         # Determine overall health status
         if not concerns:
@@ -210,41 +220,34 @@ class CompleteKiosk:
     
     def _map_concerns_to_specialties(self, concerns):
         """Map health concerns to medical specialties"""
-        specialty_mapping = {
-            "Elevated blood pressure": ["Cardiology", "General Practice"],
-            "Slight fever detected": ["General Practice", "Internal Medicine"],
-            "Slightly elevated heart rate": ["Cardiology"]
-        }
-        
-        specialties = set()
-        for concern in concerns:
-            if concern in specialty_mapping:
-                specialties.update(specialty_mapping[concern])
-        
-        return list(specialties) if specialties else ["General Practice"]
+        # Concerns without a mapping are skipped, so a new vital rule can't break the lookup
+        known = frozenset(concern for concern in concerns if concern in SPECIALTY_MAPPING)
+        return list(CONCERN_SPECIALTIES[known])
     
     def _generate_recommendations(self, diagnosis):
         """Generate final recommendations with doctor matching"""
+        from sqlalchemy import or_
         from app.models.database import SessionLocal
         from app.models.doctor import Doctor
         
         db = SessionLocal()
         
         try:
-            # Find matching doctors based on recommended specialties
+            # Find matching doctors for all recommended specialties in one query
+            clauses = [Doctor.specialty.ilike(f"%{specialty}%") for specialty in diagnosis["recommended_specialties"]]
+            doctors = db.query(Doctor).filter(or_(*clauses)).all()
+            
             recommended_doctors = []
-            for specialty in diagnosis["recommended_specialties"]:
-                doctors = db.query(Doctor).filter(Doctor.specialty.ilike(f"%{specialty}%")).all()
-                for doctor in doctors:
-                    recommended_doctors.append({
-                        "id": doctor.id,
-                        "name": doctor.name,
-                        "specialty": doctor.specialty,
-                        "contact": doctor.contact,
-                        "address": doctor.address,
-                        "city": doctor.city,
-                        "location": f"{doctor.address}, {doctor.city}"
-                    })
+            for doctor in doctors:
+                recommended_doctors.append({
+                    "id": doctor.id,
+                    "name": doctor.name,
+                    "specialty": doctor.specialty,
+                    "contact": doctor.contact,
+                    "address": doctor.address,
+                    "city": doctor.city,
+                    "location": f"{doctor.address}, {doctor.city}"
+                })
             
             return {
                 "recommendations": {
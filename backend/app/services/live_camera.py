@@ -2,78 +2,219 @@
 import cv2
 import threading
 import time
-import base64
 from typing import Optional, Callable
 
+try:
+    import pybase64  # SIMD base64 (AVX2/NEON), several times faster on JPEG-sized buffers
+except ImportError:
+    pybase64 = None
+    import base64
+
+try:
+    from turbojpeg import TurboJPEG  # libjpeg-turbo SIMD DCT/colour conversion
+    _turbojpeg = TurboJPEG()
+except (ImportError, OSError, RuntimeError):  # Binding or shared library missing
+    _turbojpeg = None
+
+FRAME_PERIOD = 1 / 30  # ~30 FPS
+DETECTION_INTERVAL = 5  # Run the face detector on every Nth frame (~6 Hz)
+DETECTION_WIDTH = 640  # Frames wider than this are downscaled before detection
+JPEG_DATA_URI_PREFIX = "data:image/jpeg;base64,"
+
+def encode_jpeg(frame, quality: int = 95):
+    """JPEG-encode a BGR frame to bytes, preferring TurboJPEG over cv2.imencode"""
+    if _turbojpeg is not None:
+        return _turbojpeg.encode(frame, quality=quality)
+    _, buffer = cv2.imencode('.jpg', frame, [cv2.IMWRITE_JPEG_QUALITY, quality])
+    return buffer.tobytes()
+
+_face_cascade = None
+_face_cascade_lock = threading.Lock()
+
+def get_face_cascade():
+    """Load the Haar cascade once per process and share it between kiosks"""
+    global _face_cascade
+    with _face_cascade_lock:
+        if _face_cascade is None:
+            _face_cascade = cv2.CascadeClassifier(cv2.data.haarcascades + 'haarcascade_frontalface_default.xml')
+    return _face_cascade
+
+def open_camera(index: int = 0):
+    """Open a capture device configured for low latency"""
+    cap = cv2.VideoCapture(index)
+    # Keep only the newest frame so reads are never stale, and let the camera send MJPG
+    # so decoding goes through libjpeg-turbo instead of a per-frame YUYV conversion
+    cap.set(cv2.CAP_PROP_BUFFERSIZE, 1)
+    cap.set(cv2.CAP_PROP_FOURCC, cv2.VideoWriter_fourcc(*'MJPG'))
+    cap.set(cv2.CAP_PROP_FRAME_WIDTH, 1280)
+    cap.set(cv2.CAP_PROP_FRAME_HEIGHT, 720)
+    cap.set(cv2.CAP_PROP_FPS, 30)
+    return cap
+
+def detect_faces(face_cascade, frame, min_face: int = 100):
+    """Run Haar detection on a downscaled grayscale copy and return full-resolution boxes"""
+    height, width = frame.shape[:2]
+    scale = min(1.0, DETECTION_WIDTH / width)
+    small = frame
+    if scale < 1.0:
+        small = cv2.resize(frame, (int(width * scale), int(height * scale)), interpolation=cv2.INTER_AREA)
+    gray = cv2.cvtColor(small, cv2.COLOR_BGR2GRAY)
+    # scaleFactor 1.2 roughly halves the pyramid levels compared to 1.1
+    min_size = max(1, int(min_face * scale))
+    # The classifier is shared across threads; serialize detection on it
+    with _face_cascade_lock:
+        faces = face_cascade.detectMultiScale(gray, 1.2, 5, minSize=(min_size, min_size))
+    return [tuple(int(v / scale) for v in face) for face in faces]
+
+def to_jpeg_data_uri(buffer) -> str:
+    """Base64-encode a JPEG buffer as a data URI"""
+    if pybase64 is not None:
+        return JPEG_DATA_URI_PREFIX + pybase64.b64encode_as_string(buffer)
+    return JPEG_DATA_URI_PREFIX + base64.b64encode(buffer).decode('utf-8')
+
 class LiveCameraSystem:
     def __init__(self):
         self.cap = None
         self.is_running = False
         self.current_frame = None
         self.face_detected = False
-        self.face_cascade = cv2.CascadeClassifier(cv2.data.haarcascades + 'haarcascade_frontalface_default.xml')
+        self._last_faces = ()
+        self._face_event = threading.Event()  # Set while a face is in view
+        self._face_since = None  # Monotonic time the current face first appeared
+        self._det_counter = 0
+        self.face_cascade = get_face_cascade()
         self.on_face_detected = None
         self.camera_thread = None
+        # Encode each captured frame at most once, however often it's polled
+        self._frame_id = 0
+        self._encoded_id = -1
+        self._encoded_cache = None
+        self._data_uri_source = None
+        self._data_uri_cache = None
+        self._preview_buf = None
+        self._encode_lock = threading.Lock()
+        self._lifecycle_lock = threading.Lock()  # Serializes start/stop across kiosks sharing the camera
         
     def start_camera(self):
         """Start the live camera feed"""
-        try:
-            self.cap = cv2.VideoCapture(0)
-            if not self.cap.isOpened():
-                raise Exception("Cannot access camera")
+        with self._lifecycle_lock:
+            # Already running for another kiosk: reuse it instead of opening the device again
+            if self.is_running:
+                return True
             
-            self.is_running = True
-            self.camera_thread = threading.Thread(target=self._camera_loop)
-            self.camera_thread.daemon = True
-            self.camera_thread.start()
-            return True
-        except Exception as e:
-            print(f"Camera error: {e}")
-            return False
+            try:
+                self.cap = open_camera()
+                if not self.cap.isOpened():
+                    raise Exception("Cannot access camera")
+                
+                # Start from a clean slate so nothing from a previous session counts
+                # as a face already in view (or already stable)
+                self.face_detected = False
+                self._face_since = None
+                self._last_faces = ()
+                self._face_event.clear()
+                self._det_counter = 0
+                
+                self.is_running = True
+                self.camera_thread = threading.Thread(target=self._camera_loop)
+                self.camera_thread.daemon = True
+                self.camera_thread.start()
+                return True
+            except Exception as e:
+                print(f"Camera error: {e}")
+                return False
     
     def _camera_loop(self):
         """Main camera processing loop"""
+        deadline = time.monotonic()
         while self.is_running and self.cap.isOpened():
             ret, frame = self.cap.read()
             if not ret:
                 continue
             
             self.current_frame = frame
+            self._frame_id += 1
             
-            # Detect faces in real-time
-            gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
-            faces = self.face_cascade.detectMultiScale(gray, 1.1, 5, minSize=(100, 100))
-            
-            # Update face detection status
-            had_face = self.face_detected
-            self.face_detected = len(faces) > 0
+            # Detect faces every Nth frame; presence doesn't change within ~150 ms,
+            # so in-between frames reuse the last result
+            if self._det_counter % DETECTION_INTERVAL == 0:
+                faces = detect_faces(self.face_cascade, frame)
+                self._last_faces = faces
+                
+                # Update face detection status
+                had_face = self.face_detected
+                self.face_detected = len(faces) > 0
+                if self.face_detected:
+                    if not had_face:
+                        self._face_since = time.monotonic()
+                    self._face_event.set()
+                else:
+                    self._face_since = None
+                    self._face_event.clear()
+                
+                # Trigger callback when face first appears
+                if self.face_detected and not had_face and self.on_face_detected:
+                    self.on_face_detected(faces)
+            self._det_counter += 1
             
-            # Trigger callback when face first appears
-            if self.face_detected and not had_face and self.on_face_detected:
-                self.on_face_detected(faces)
-            
-            # Draw face rectangles on frame
-            for (x, y, w, h) in faces:
-                cv2.rectangle(frame, (x, y), (x+w, y+h), (0, 255, 0), 2)
-                cv2.putText(frame, "FACE DETECTED", (x, y-10), 
-                           cv2.FONT_HERSHEY_SIMPLEX, 0.5, (0, 255, 0), 2)
+            # Pace against absolute deadlines so processing time doesn't drift the frame rate
+            deadline += FRAME_PERIOD
+            now = time.monotonic()
+            if deadline < now - FRAME_PERIOD:
+                deadline = now  # Far behind: resync instead of bursting to catch up
+            time.sleep(max(0.0, deadline - now))
+    
+    def get_live_jpeg(self) -> Optional[bytes]:
+        """Get current camera frame, with face overlay, as JPEG bytes"""
+        if self.current_frame is None:
+            return None
+        
+        with self._encode_lock:
+            frame_id = self._frame_id
+            if self._encoded_id == frame_id:
+                return self._encoded_cache
             
-            time.sleep(0.03)  # ~30 FPS
+            try:
+                source = self.current_frame
+                faces = self._last_faces
+                # Resize into a preview buffer reused across frames (guarded by _encode_lock)
+                # and draw on that, so the captured frame is never mutated and nothing
+                # is drawn unless polled
+                self._preview_buf = cv2.resize(source, (640, 480), dst=self._preview_buf)
+                frame = self._preview_buf
+                sx = 640 / source.shape[1]
+                sy = 480 / source.shape[0]
+                
+                # Draw face rectangles on frame
+                for (x, y, w, h) in faces:
+                    x, y, w, h = int(x * sx), int(y * sy), int(w * sx), int(h * sy)
+                    cv2.rectangle(frame, (x, y), (x+w, y+h), (0, 255, 0), 2)
+                    cv2.putText(frame, "FACE DETECTED", (x, y-10), 
+                               cv2.FONT_HERSHEY_SIMPLEX, 0.5, (0, 255, 0), 2)
+                
+                self._encoded_cache = encode_jpeg(frame, quality=70)
+                self._encoded_id = frame_id
+                return self._encoded_cache
+            except Exception as e:
+                print(f"Frame encoding error: {e}")
+                return None
     
     def get_live_frame(self) -> Optional[str]:
         """Get current camera frame as base64"""
-        if self.current_frame is None:
+        jpeg = self.get_live_jpeg()
+        if jpeg is None:
             return None
         
-        try:
-            # Resize for performance
-            frame = cv2.resize(self.current_frame, (640, 480))
-            _, buffer = cv2.imencode('.jpg', frame, [cv2.IMWRITE_JPEG_QUALITY, 70])
-            jpg_as_text = base64.b64encode(buffer).decode('utf-8')
-            return f"data:image/jpeg;base64,{jpg_as_text}"
-        except Exception as e:
-            print(f"Frame encoding error: {e}")
-            return None
+        with self._encode_lock:
+            if self._data_uri_source is not jpeg:
+                self._data_uri_cache = to_jpeg_data_uri(jpeg)
+                self._data_uri_source = jpeg
+            return self._data_uri_cache
+    
+    @property
+    def last_faces(self):
+        """Face boxes from the most recent detection pass"""
+        return self._last_faces
     
     def get_camera_status(self) -> dict:
         """Get current camera and face detection status"""
@@ -85,17 +226,34 @@ class LiveCameraSystem:
     
     def wait_for_face(self, timeout: int = 30) -> bool:
         """Wait for a face to be detected"""
-        start_time = time.time()
-        while time.time() - start_time < timeout:
-            if self.face_detected:
-                return True
-            time.sleep(0.5)
+        # Woken by the camera loop as soon as a face appears, no polling
+        return self._face_event.wait(timeout)
+    
+    def wait_for_stable_face(self, duration: float = 1.5, timeout: float = 2.0) -> bool:
+        """Wait until a face has stayed in view for `duration` seconds"""
+        deadline = time.monotonic() + timeout
+        while self._face_event.wait(max(0.0, deadline - time.monotonic())):
+            since = self._face_since
+            if since is not None:
+                remaining = duration - (time.monotonic() - since)
+                if remaining <= 0:
+                    return True
+                if time.monotonic() + remaining > deadline:
+                    return False
+                # Sleep exactly until the face would count as stable, then re-check
+                time.sleep(remaining)
         return False
     
     def stop_camera(self):
         """Stop the camera"""
-        self.is_running = False
-        if self.cap:
-            self.cap.release()
-        if self.camera_thread:
-            self.camera_thread.join(timeout=2.0)
\ No newline at end of file
+        with self._lifecycle_lock:
+            self.is_running = False
+            # Let an in-flight detection pass finish before resetting face state,
+            # otherwise it can set the event again after the clear
+            if self.camera_thread:
+                self.camera_thread.join(timeout=2.0)
+            if self.cap:
+                self.cap.release()
+            self.face_detected = False
+            self._face_since = None
+            self._face_event.clear()
\ No newline at end of file
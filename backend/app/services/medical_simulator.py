@@ -12,6 +12,11 @@ class RealisticMedicalSim:
             "hypertension": {"symptoms": ["Headache", "Dizziness"], "urgency": "high"},
             "asthma": {"symptoms": ["Wheezing", "Shortness of Breath"], "urgency": "high"}
         }
+        # conditions_db is static, so hash each condition's symptoms once up front
+        self._condition_index = [
+            (condition, frozenset(data["symptoms"]), len(data["symptoms"]), data["urgency"])
+            for condition, data in self.conditions_db.items()
+        ]
     
     def generate_realistic_vitals(self, age=30):
         """Generate medically plausible vital signs"""
@@ -33,17 +38,18 @@ class RealisticMedicalSim:
     def analyze_symptoms(self, symptoms, vitals):
         """Real symptom analysis using your RTX for processing"""
         matched_conditions = []
+        reported = frozenset(symptoms)
         
-        for condition, data in self.conditions_db.items():
-            symptom_matches = set(symptoms) & set(data["symptoms"])
+        for condition, condition_symptoms, symptom_count, urgency in self._condition_index:
+            symptom_matches = reported & condition_symptoms
             if symptom_matches:
-                match_score = len(symptom_matches) / len(data["symptoms"])
+                match_score = len(symptom_matches) / symptom_count
                 if match_score > 0.3:  # 30% match threshold
                     matched_conditions.append({
                         "condition": condition,
                         "matched_symptoms": list(symptom_matches),
                         "confidence": round(match_score * 100),
-                        "urgency": data["urgency"]
+                        "urgency": urgency
                     })
         
         # Sort by confidence
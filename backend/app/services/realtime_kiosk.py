@@ -46,18 +46,13 @@ class RealTimeKiosk:
         print("👤 Waiting for user to approach...")
         
         start_time = time.time()
-        while time.time() - start_time < timeout:
-            status = self.camera.get_camera_status()
-            
-            if status["face_detected"]:
-                print("✅ User detected!")
-                return {
-                    "status": "user_detected",
-                    "wait_time": round(time.time() - start_time, 2),
-                    "message": "User is now in front of camera"
-                }
-            
-            time.sleep(0.5)
+        if self.camera.wait_for_face(timeout):
+            print("✅ User detected!")
+            return {
+                "status": "user_detected",
+                "wait_time": round(time.time() - start_time, 2),
+                "message": "User is now in front of camera"
+            }
         
         return {
             "status": "timeout", 
@@ -69,16 +64,8 @@ class RealTimeKiosk:
         """Capture user data once face is detected"""
         print("📸 Capturing user session...")
         
-        # Wait for stable face detection
-        stable_count = 0
-        for _ in range(20):  # Check for 2 seconds
-            if self.camera.face_detected:
-                stable_count += 1
-            else:
-                stable_count = 0
-            time.sleep(0.1)
-        
-        if stable_count < 15:  # Need 75% stability
+        # Wait for stable face detection: 1.5 s continuously in view, within 2 s
+        if not self.camera.wait_for_stable_face(duration=1.5, timeout=2.0):
             return {"error": "Face not stable"}
         
         # Capture user photo